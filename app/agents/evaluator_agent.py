@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Iterable, Tuple, Optional
+from typing import Iterable, Mapping, Tuple, Optional
 
 from app.agents.evaluator_llm import evaluate_with_llm
 from app.agents.evaluator_scoring import pick_best_offer
@@ -10,11 +10,13 @@ def evaluate_offers(
     user_query: str,
     offers: Iterable[object],
     llm_client: Optional[object] = None,
+    profiles: Optional[Mapping[Tuple[str, str], object]] = None,
 ) -> Tuple[str, str]:
     """
     Evaluator:
     - If llm_client is available, use LLM-based evaluation (grounded on retrieved offers)
     - Otherwise fall back to deterministic scoring (constraint + risk + price + delivery)
+    - Both paths take supplier history into account when profiles are provided
     """
     offers_list = list(offers)
     if not offers_list:
@@ -22,9 +24,14 @@ def evaluate_offers(
 
     if llm_client is not None:
         try:
-            return evaluate_with_llm(user_query=user_query, offers=offers_list, llm_client=llm_client)
+            return evaluate_with_llm(
+                user_query=user_query,
+                offers=offers_list,
+                llm_client=llm_client,
+                profiles=profiles,
+            )
         except Exception:
             # Any LLM failure -> deterministic fallback
-            return pick_best_offer(user_query=user_query, offers=offers_list)
+            return pick_best_offer(user_query=user_query, offers=offers_list, profiles=profiles)
 
-    return pick_best_offer(user_query=user_query, offers=offers_list)
+    return pick_best_offer(user_query=user_query, offers=offers_list, profiles=profiles)
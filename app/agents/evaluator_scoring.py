@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import math
 import re
 from dataclasses import dataclass
-from typing import Iterable, Optional, Tuple, List
+from typing import Iterable, Mapping, Optional, Tuple, List
 
 
 @dataclass(frozen=True)
@@ -69,11 +70,98 @@ def risk_penalty(risk_text: str) -> float:
     return 0.0
 
 
+def profile_for(offer: object, profiles: Optional[Mapping[Tuple[str, str], object]]) -> Optional[object]:
+    """
+    Look up the supplier profile for an offer (profiles are keyed by (supplier, item)).
+    """
+    if not profiles:
+        return None
+    return profiles.get((getattr(offer, "supplier", None), getattr(offer, "item", None) or ""))
+
+
+def risk_bucket(risk_text: str) -> Optional[str]:
+    """
+    Bucket free-text risk into "high" / "medium" / "low" (None if neutral),
+    consistent with risk_penalty.
+    """
+    penalty = risk_penalty(risk_text)
+    if penalty >= 2.0:
+        return "high"
+    if penalty >= 1.0:
+        return "medium"
+    if penalty < 0:
+        return "low"
+    return None
+
+
+def history_penalty(
+    profile: Optional[object],
+    delivery_days: Optional[int] = None,
+    risk_assessment: str = "",
+) -> float:
+    """
+    Convert a supplier's historical profile into a numeric penalty.
+    Higher penalty = worse.
+
+    The profile already includes the offer being scored (it was folded in at ingest),
+    so that observation is removed first: the offer's own risk text is scored by
+    risk_penalty and must not count twice. Needs at least one other quotation.
+
+    - Share of historically high/medium-risk notes adds penalty, low-risk history reduces it
+    - Inconsistent delivery (coefficient of variation) adds up to 0.5
+    """
+    if profile is None:
+        return 0.0
+    count = getattr(profile, "quote_count", 0) or 0
+    others = count - 1
+    if others < 1:
+        return 0.0
+
+    risk_counts = {
+        "high": getattr(profile, "risk_high_count", 0) or 0,
+        "medium": getattr(profile, "risk_medium_count", 0) or 0,
+        "low": getattr(profile, "risk_low_count", 0) or 0,
+    }
+    own_bucket = risk_bucket(risk_assessment)
+    if own_bucket is not None:
+        risk_counts[own_bucket] = max(risk_counts[own_bucket] - 1, 0)
+
+    penalty = (2.0 * risk_counts["high"] + 1.0 * risk_counts["medium"] - 0.5 * risk_counts["low"]) / others
+
+    # Reverse the Welford update for the offer's own delivery days
+    mean = getattr(profile, "delivery_mean", 0.0) or 0.0
+    m2 = (getattr(profile, "delivery_variance", 0.0) or 0.0) * count
+    days = float(delivery_days or 0)
+    others_mean = (mean * count - days) / others
+    others_m2 = max(m2 - (days - others_mean) * (days - mean), 0.0)
+    std = math.sqrt(others_m2 / others)
+    penalty += min(std / max(others_mean, 1.0), 1.0) * 0.5
+
+    return penalty
+
+
+def describe_history(profile: Optional[object]) -> str:
+    """
+    One-line human readable summary of a supplier profile.
+    """
+    if profile is None:
+        return ""
+    count = getattr(profile, "quote_count", 0) or 0
+    std = math.sqrt(getattr(profile, "delivery_variance", 0.0) or 0.0)
+    return (
+        f"history: {count} quotes, median_price={getattr(profile, 'median_price', None)}, "
+        f"min_price={getattr(profile, 'min_price', None)}, "
+        f"delivery={getattr(profile, 'delivery_mean', 0.0):.1f}±{std:.1f} days, "
+        f"high_risk_notes={getattr(profile, 'risk_high_count', 0)}"
+    )
+
+
 def score_offer(
     unit_price: Optional[float],
     delivery_days: Optional[int],
     risk_assessment: str,
     constraints: Constraints,
+    profile: Optional[object] = None,
 ) -> float:
     """
     Score an offer (higher is better).
@@ -82,6 +170,7 @@ def score_offer(
     - Lower price and faster delivery score higher
     - Violating an explicit constraint gets a strong penalty
     - Risk text applies penalty
+    - Supplier history (if a profile is available) applies penalty
     """
     score = 0.0
 
@@ -104,14 +193,21 @@ def score_offer(
     # Risk contribution
     score -= risk_penalty(risk_assessment)
 
+    # Historical contribution (excluding this offer's own observation)
+    score -= history_penalty(profile, delivery_days=delivery_days, risk_assessment=risk_assessment)
+
     return score
 
 
-def pick_best_offer(user_query: str, offers: Iterable[object]) -> Tuple[str, str]:
+def pick_best_offer(
+    user_query: str,
+    offers: Iterable[object],
+    profiles: Optional[Mapping[Tuple[str, str], object]] = None,
+) -> Tuple[str, str]:
     """
     Deterministic evaluator:
     - extract constraints from user_query
-    - score each offer
+    - score each offer (including supplier history when profiles are given)
     - pick best
     - return (recommendation, reasoning) with a short top-3 summary
     """
@@ -128,6 +224,7 @@ def pick_best_offer(user_query: str, offers: Iterable[object]) -> Tuple[str, str
             delivery_days=getattr(o, "delivery_days", None),
             risk_assessment=getattr(o, "risk_assessment", "") or "",
             constraints=constraints,
+            profile=profile_for(o, profiles),
         )
         scored.append((s, o))
 
@@ -150,9 +247,11 @@ def pick_best_offer(user_query: str, offers: Iterable[object]) -> Tuple[str, str
         unit_price = getattr(o, "unit_price", None)
         delivery_days = getattr(o, "delivery_days", None)
         risk = (getattr(o, "risk_assessment", "") or "").strip()
+        history = describe_history(profile_for(o, profiles))
         lines.append(
             f"{idx}. {supplier} — unit_price={unit_price}, delivery_days={delivery_days}, risk='{risk}'"
             + (f", item='{item}'" if item else "")
+            + (f" ({history})" if history else "")
         )
 
     return best_supplier, "\n".join(lines)
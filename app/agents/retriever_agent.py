@@ -1,17 +1,41 @@
 from typing import List
+
+from sqlalchemy import func, select, union_all
 from sqlalchemy.orm import Session
 
 from app.models.db_models import Quotation
 from app.core.embeddings import generate_embedding
 
+RETRIEVAL_MODES = ("vector", "hybrid")
+
+# Reciprocal rank fusion constant (60 is the value from the original RRF paper)
+RRF_K = 60
+
+# How many candidates each ranker contributes before fusion, per requested result
+HYBRID_CANDIDATE_MULTIPLIER = 4
+
 
-def retrieve_quotations(query: str, db: Session, top_k: int = 5) -> List[Quotation]:
+def retrieve_quotations(
+    query: str,
+    db: Session,
+    top_k: int = 5,
+    mode: str = "vector",
+) -> List[Quotation]:
     """
-    Retrieve the most relevant quotations using vector similarity search.
-    Uses pgvector distance ordering on the embedding column.
+    Retrieve the most relevant quotations for a query.
+
+    Modes:
+    - "vector": pgvector cosine distance ordering on the embedding column
+    - "hybrid": vector + Postgres full-text search merged with reciprocal rank fusion
     """
+    if mode not in RETRIEVAL_MODES:
+        raise ValueError(f"Unknown retrieval mode: {mode!r} (expected one of {RETRIEVAL_MODES})")
+
     query_vec = generate_embedding(query)
 
+    if mode == "hybrid":
+        return _retrieve_hybrid(query, query_vec, db, top_k)
+
     # pgvector SQLAlchemy helpers expose distance functions on the Vector column
     results = (
         db.query(Quotation)
@@ -21,3 +45,63 @@ def retrieve_quotations(query: str, db: Session, top_k: int = 5) -> List[Quotati
     )
 
     return results
+
+
+def _retrieve_hybrid(query: str, query_vec: List[float], db: Session, top_k: int) -> List[Quotation]:
+    """
+    Run lexical and vector rankings as CTEs of a single statement and fuse them.
+
+    Each quotation scores sum(1 / (RRF_K + rank)) over the rankers that returned it,
+    so exact supplier names / part numbers can surface even when cosine similarity misses.
+    """
+    candidates = max(top_k * HYBRID_CANDIDATE_MULTIPLIER, top_k)
+
+    # ORDER BY ... LIMIT runs in an inner subquery so Postgres can use a top-N sort
+    # (or the vector index); row_number() then only ranks the limited candidates.
+    distance = Quotation.embedding.cosine_distance(query_vec)
+    vector_top = (
+        select(Quotation.id.label("id"), distance.label("distance"))
+        .order_by(distance)
+        .limit(candidates)
+        .subquery("vector_top")
+    )
+    vector_ranked = select(
+        vector_top.c.id,
+        func.row_number().over(order_by=vector_top.c.distance).label("rank"),
+    ).cte("vector_ranked")
+
+    # websearch_to_tsquery tolerates free-form user input (quotes, "or", "-term")
+    ts_query = func.websearch_to_tsquery("english", query)
+    lexical_score = func.ts_rank_cd(Quotation.search_tsv, ts_query)
+    lexical_top = (
+        select(Quotation.id.label("id"), lexical_score.label("score"))
+        .where(Quotation.search_tsv.op("@@")(ts_query))
+        .order_by(lexical_score.desc())
+        .limit(candidates)
+        .subquery("lexical_top")
+    )
+    lexical_ranked = select(
+        lexical_top.c.id,
+        func.row_number().over(order_by=lexical_top.c.score.desc()).label("rank"),
+    ).cte("lexical_ranked")
+
+    contributions = union_all(
+        select(vector_ranked.c.id, (1.0 / (RRF_K + vector_ranked.c.rank)).label("score")),
+        select(lexical_ranked.c.id, (1.0 / (RRF_K + lexical_ranked.c.rank)).label("score")),
+    ).subquery("contributions")
+
+    fused = (
+        select(contributions.c.id, func.sum(contributions.c.score).label("rrf_score"))
+        .group_by(contributions.c.id)
+        .subquery("fused")
+    )
+
+    results = (
+        db.query(Quotation)
+        .join(fused, fused.c.id == Quotation.id)
+        .order_by(fused.c.rrf_score.desc(), Quotation.id)
+        .limit(top_k)
+        .all()
+    )
+
+    return results
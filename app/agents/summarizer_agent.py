@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Any, Dict, Iterable, Optional
 
+from app.core.prompt_builder import log_prompt_tokens, render_offers
+
 
 def summarize_decision(
     user_query: str,
@@ -15,15 +17,7 @@ def summarize_decision(
     if llm_client is None:
         return f"Recommended {recommendation} based on the retrieved offers and request constraints."
 
-    payload = [
-        {
-            "supplier": getattr(o, "supplier", None),
-            "unit_price": getattr(o, "unit_price", None),
-            "delivery_days": getattr(o, "delivery_days", None),
-            "risk_assessment": getattr(o, "risk_assessment", None),
-        }
-        for o in offers_list
-    ]
+    rendered = render_offers(offers_list)
 
     system = (
         "You are a summarization agent. Use only the provided offers and decision. "
@@ -32,9 +26,11 @@ def summarize_decision(
     user = (
         f"User request: {user_query}\n"
         f"Decision: {recommendation}\n"
-        f"Offers: {payload}\n"
-        "Summarize why the decision matches the request."
+        f"{rendered.text}\n"
+        "Summarize why the decision matches the request. Use full supplier names, not aliases."
     )
 
+    log_prompt_tokens("summarizer", system, user)
+
     data: Dict[str, Any] = llm_client.chat_json(system=system, user=user)
     return (data.get("summary") or "").strip() or f"Recommended {recommendation} based on the retrieved offers."
@@ -6,10 +6,11 @@ from app.schemas.query import QueryRequest, QueryResponse, OfferEvaluation
 from app.schemas.version import VersionResponse
 from app.core.config import API_VERSION, API_NAME, API_DESCRIPTION
 from app.core.db import get_db
-from app.services.ingestion_service import ingest_quotation
-from app.services.query_service import run_query
 from app.core.llm_client import build_llm_client, LLMClientError
 
+# Service modules (ORM models, pgvector, NumPy) are imported inside the handlers so
+# worker boot stays cheap; they load on first use or during optional warm-up.
+
 router = APIRouter()
 
 
@@ -44,6 +45,8 @@ def upload_quotation(
     - Store quotation in the database
     - Return the new quotation ID and a confirmation message
     """
+    from app.services.ingestion_service import ingest_quotation
+
     quotation = ingest_quotation(payload.text, db, llm_client)
 
     return UploadResponse(
@@ -63,12 +66,21 @@ def query_text(
 
     Current behaviour:
     - Retrieve top-k quotations using vector similarity
+      (or hybrid full-text + vector search when retrieval_mode="hybrid")
     - Evaluate retrieved offers (simple heuristic for now)
 
     Later:
     - Use llm_client (if available) to produce grounded recommendation + reasoning
     """
-    return run_query(payload.query, db=db, top_k=5, llm_client=llm_client)
+    from app.services.query_service import run_query
+
+    return run_query(
+        payload.query,
+        db=db,
+        top_k=5,
+        llm_client=llm_client,
+        retrieval_mode=payload.retrieval_mode,
+    )
 
 
 @router.get("/version", response_model=VersionResponse, tags=["meta"])
@@ -0,0 +1,87 @@
+"""
+Operational commands that run outside the API process.
+
+Usage:
+    python -m app.cli migrate
+    python -m app.cli rebuild-profiles
+    python -m app.cli export-snapshot ./snapshots/corpus
+    python -m app.cli import-snapshot ./snapshots/corpus
+"""
+from __future__ import annotations
+
+import argparse
+
+from app.core.db import SessionLocal
+
+
+def migrate(args: argparse.Namespace) -> None:
+    from app.core.db import migrate_schema
+
+    migrate_schema()
+    print("Schema is up to date.")
+
+
+def rebuild_profiles(args: argparse.Namespace) -> None:
+    from app.services.supplier_profile_service import rebuild_supplier_profiles
+
+    db = SessionLocal()
+    try:
+        written = rebuild_supplier_profiles(db, batch_size=args.batch_size)
+    finally:
+        db.close()
+    print(f"Rebuilt {written} supplier profiles.")
+
+
+def export_snapshot(args: argparse.Namespace) -> None:
+    from app.services.snapshot_service import export_snapshot as run_export
+
+    result = run_export(args.snapshot_dir, chunk_size=args.chunk_size)
+    if result.rows:
+        print(f"Exported {result.rows} quotations to {result.part} (watermark id={result.last_id}).")
+    else:
+        print(f"No new quotations above watermark id={result.last_id}.")
+
+
+def import_snapshot(args: argparse.Namespace) -> None:
+    from app.services.snapshot_service import import_snapshot as run_import
+
+    result = run_import(args.snapshot_dir, chunk_size=args.chunk_size)
+    print(
+        f"Imported {result.rows} quotations, skipped {result.skipped} already present "
+        f"(snapshot max id={result.last_id})."
+    )
+
+    if result.rows and not args.skip_profiles:
+        rebuild_profiles(argparse.Namespace(batch_size=args.chunk_size))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    migrate_cmd = commands.add_parser("migrate", help="Create / upgrade the database schema (run once per deploy)")
+    migrate_cmd.set_defaults(handler=migrate)
+
+    rebuild = commands.add_parser("rebuild-profiles", help="Recompute supplier_profiles from all quotations")
+    rebuild.add_argument("--batch-size", type=int, default=1000)
+    rebuild.set_defaults(handler=rebuild_profiles)
+
+    export_cmd = commands.add_parser(
+        "export-snapshot", help="Append quotations above the snapshot's id watermark as a Parquet part"
+    )
+    export_cmd.add_argument("snapshot_dir")
+    export_cmd.add_argument("--chunk-size", type=int, default=1000)
+    export_cmd.set_defaults(handler=export_snapshot)
+
+    import_cmd = commands.add_parser("import-snapshot", help="Bulk load a snapshot with COPY (no LLM / embedding calls)")
+    import_cmd.add_argument("snapshot_dir")
+    import_cmd.add_argument("--chunk-size", type=int, default=1000)
+    import_cmd.add_argument("--skip-profiles", action="store_true", help="Do not rebuild supplier profiles afterwards")
+    import_cmd.set_defaults(handler=import_snapshot)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import re
+from typing import Optional
+
+UNKNOWN_CATEGORY = "other"
+
+# Words that open a qualifier clause; everything from them on describes, not names, the item
+_QUALIFIER_SPLIT = re.compile(
+    r"[,;:/]| - | – | \b(?:for|with|without|in|to|per|from|incl|including|suitable|according"
+    r"|size|colour|color)\b"
+)
+
+# Packaging nouns that precede the real item ("box of screws" -> "screws")
+_PACKAGING_OF = re.compile(
+    r"^(?:\w+\s+)?(?:box|boxes|pack|packs|set|sets|pair|pairs|roll|rolls|pallet|pallets|"
+    r"case|cases|carton|cartons|bag|bags|reel|reels)\s+of\s+(.+)$"
+)
+
+# Units and standards that are not item nouns even when written as bare words
+_NON_NOUN_TOKENS = {
+    "mm", "cm", "m", "km", "in", "inch", "inches", "ft", "kg", "g", "gsm", "mg", "lb", "lbs",
+    "ml", "l", "ltr", "litre", "litres", "pcs", "pc", "pce", "unit", "units", "qty", "x",
+    "din", "iso", "en", "ansi", "astm", "bs", "jis", "sae", "uni", "grade", "class", "type",
+    "size", "colour", "color",
+}
+
+
+# -f/-fe plurals; a general "-ves" rule would break drives, valves, sleeves ...
+_IRREGULAR_PLURALS = {
+    "knives": "knife",
+    "shelves": "shelf",
+    "halves": "half",
+    "leaves": "leaf",
+    "wolves": "wolf",
+}
+
+
+def _singular(word: str) -> str:
+    if word in _IRREGULAR_PLURALS:
+        return _IRREGULAR_PLURALS[word]
+    if len(word) <= 3:
+        return word
+    if word.endswith("ies") and len(word) > 4:
+        return word[:-3] + "y"
+    if word.endswith(("sses", "shes", "ches", "xes", "zes")):
+        return word[:-2]
+    if word.endswith("s") and not word.endswith(("ss", "us", "is", "as")):
+        return word[:-1]
+    return word
+
+
+def item_category(item_description: Optional[str]) -> str:
+    """
+    Derive a coarse item category from a free-text item description.
+
+    Takes the head noun of the leading noun phrase: parenthesised codes and
+    qualifier clauses ("..., zinc plated", "... for marine use") are dropped, as
+    are sizes, units and standard codes. E.g. "Hex bolts DIN 933 M10" -> "bolt".
+    """
+    text = re.sub(r"\([^)]*\)", " ", (item_description or "").lower()).strip()
+    text = _QUALIFIER_SPLIT.split(text, maxsplit=1)[0].strip()
+
+    packaged = _PACKAGING_OF.match(text)
+    if packaged:
+        text = packaged.group(1)
+
+    words = [
+        w
+        for w in re.findall(r"[a-z0-9][a-z0-9\-]*", text)
+        if not any(c.isdigit() for c in w) and w not in _NON_NOUN_TOKENS and len(w) >= 2
+    ]
+    if not words:
+        return UNKNOWN_CATEGORY
+
+    return _singular(words[-1])[:100]
@@ -10,6 +10,14 @@ class Settings(BaseSettings):
     openai_api_key: str | None = None
     llm_model: str = "gpt-4o-mini"
 
+    # Startup behaviour: disable migrations when a dedicated `python -m app.cli migrate` runs instead
+    migrate_on_startup: bool = True
+    warmup_on_startup: bool = False
+
+    # Prompt token budgets (counted with the local tokenizer)
+    prompt_field_token_budget: int = 40
+    prompt_offers_token_budget: int = 1500
+
     model_config = SettingsConfigDict(envfile=".env")
 
 
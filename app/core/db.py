@@ -1,4 +1,7 @@
+from typing import Optional
+
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 
 from app.core.config import DATABASE_URL
@@ -12,14 +15,85 @@ engine = create_engine(
     future=True,
 )
 
-def init_db() -> None:
+# Arbitrary constant key for the Postgres advisory lock serializing schema migrations
+SCHEMA_MIGRATION_LOCK_ID = 48_151_623
+
+# Advisory lock taken shared by every quotation insert (until commit) and exclusively by
+# snapshot export, so an export never sees a later id commit before an earlier one
+QUOTATION_WRITE_LOCK_ID = 48_151_624
+
+# Bump whenever migrate_schema changes; /ready reports "not ready" until the database matches
+SCHEMA_VERSION = 3
+
+def _create_extensions(conn: Connection) -> None:
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+
+def _upgrade_search_index(conn: Connection) -> None:
+    from app.models.db_models import SEARCH_TSV_EXPRESSION
+
+    conn.execute(
+        text(
+            "ALTER TABLE quotations ADD COLUMN IF NOT EXISTS search_tsv tsvector "
+            f"GENERATED ALWAYS AS ({SEARCH_TSV_EXPRESSION}) STORED"
+        )
+    )
+    conn.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_quotations_search_tsv "
+            "ON quotations USING gin (search_tsv)"
+        )
+    )
+
+def _upgrade_supplier_profiles(conn: Connection) -> None:
+    conn.execute(
+        text(
+            "ALTER TABLE supplier_profiles ADD COLUMN IF NOT EXISTS recent_prices "
+            "double precision[] NOT NULL DEFAULT '{}'"
+        )
+    )
+
+def migrate_schema() -> None:
     """
-    Initialize database-specific extensions and settings.
+    Create / upgrade the full schema in one transaction.
 
-    - Ensures the pgvector extension is available in the current database.
+    - Holds a transaction-scoped advisory lock so concurrent callers run one at a time
+    - Extensions, tables (create_all) and the hybrid search column/index
+    - Records SCHEMA_VERSION in the schema_version table for readiness checks
+
+    Intended to run once per deploy (python -m app.cli migrate), not in every worker.
     """
+    # Registers all tables on Base.metadata (and pulls in pgvector) only when migrating
+    from app.models import db_models  # noqa: F401
+
     with engine.begin() as conn:
-        conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+        conn.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": SCHEMA_MIGRATION_LOCK_ID})
+        _create_extensions(conn)
+        Base.metadata.create_all(bind=conn)
+        _upgrade_search_index(conn)
+        _upgrade_supplier_profiles(conn)
+        conn.execute(text("CREATE TABLE IF NOT EXISTS schema_version (version integer NOT NULL)"))
+        conn.execute(text("DELETE FROM schema_version"))
+        conn.execute(text("INSERT INTO schema_version (version) VALUES (:v)"), {"v": SCHEMA_VERSION})
+
+def check_database() -> Optional[str]:
+    """
+    Readiness probe for the database.
+
+    Returns None when the database is reachable and migrated to SCHEMA_VERSION,
+    otherwise a short reason string.
+    """
+    try:
+        with engine.connect() as conn:
+            version = None
+            if conn.execute(text("SELECT to_regclass('public.schema_version')")).scalar() is not None:
+                version = conn.execute(text("SELECT max(version) FROM schema_version")).scalar()
+    except Exception as e:
+        return f"database unavailable: {e.__class__.__name__}"
+    if version is None:
+        return "schema not migrated"
+    if version < SCHEMA_VERSION:
+        return f"schema version {version} is behind {SCHEMA_VERSION}; run python -m app.cli migrate"
+    return None
 
 SessionLocal = sessionmaker(
     bind=engine,
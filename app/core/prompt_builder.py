@@ -0,0 +1,256 @@
+"""
+Shared prompt building for the LLM-backed agents.
+
+Offers are rendered as a compact pipe-separated table with short column keys.
+Repeated suppliers and items are deduplicated into alias lists (S1, I1, ...),
+and long free text is truncated to a token budget measured with a local tokenizer.
+"""
+from __future__ import annotations
+
+import logging
+import math
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Rough chars-per-token ratio used when tiktoken is unavailable
+_CHARS_PER_TOKEN = 4
+
+# Encoding used when the configured model is unknown to tiktoken (gpt-4o family)
+DEFAULT_ENCODING = "o200k_base"
+
+TRUNCATION_MARK = "…"
+
+OFFER_COLUMNS_LEGEND = "Columns: s=supplier alias, i=item alias, p=unit_price, d=delivery_days, r=risk_assessment"
+
+HISTORY_LEGEND = (
+    "Supplier history per supplier/item (n=past quotes, med/min=median/min unit_price, "
+    "dm/dsd=delivery mean/std days, hr/mr=high/medium risk notes):"
+)
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    """
+    Return a tiktoken encoding for the configured model, or None if tiktoken is unusable.
+
+    The BPE files are baked into the image (TIKTOKEN_CACHE_DIR, see Dockerfile) so this
+    never downloads on the request path. The result, including a fallback, is cached.
+    """
+    try:
+        import tiktoken  # type: ignore
+    except Exception:
+        logger.warning("tiktoken not installed; estimating prompt tokens at %d chars/token", _CHARS_PER_TOKEN)
+        return None
+    try:
+        return tiktoken.encoding_for_model(settings.llm_model)
+    except Exception:
+        pass
+    try:
+        return tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception as e:
+        logger.warning(
+            "tiktoken encoding unavailable (%s); estimating prompt tokens at %d chars/token",
+            e,
+            _CHARS_PER_TOKEN,
+        )
+        return None
+
+
+def count_tokens(text: str) -> int:
+    enc = _encoding()
+    if enc is None:
+        return math.ceil(len(text) / _CHARS_PER_TOKEN)
+    return len(enc.encode(text))
+
+
+def truncate_to_tokens(text: str, max_tokens: Optional[int]) -> str:
+    """
+    Truncate text to at most max_tokens tokens (None or <= 0 disables truncation).
+    """
+    if not text or max_tokens is None or max_tokens <= 0:
+        return text
+
+    enc = _encoding()
+    if enc is None:
+        limit = max_tokens * _CHARS_PER_TOKEN
+        return text if len(text) <= limit else text[:limit].rstrip() + TRUNCATION_MARK
+
+    tokens = enc.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return enc.decode(tokens[:max_tokens]).rstrip() + TRUNCATION_MARK
+
+
+def _cell(value: object) -> str:
+    if value is None:
+        return "?"
+    if isinstance(value, float):
+        return f"{value:g}"
+    return " ".join(str(value).replace("|", "/").split())
+
+
+def _history_cell(profile: Optional[object]) -> str:
+    if profile is None:
+        return ""
+    std = math.sqrt(getattr(profile, "delivery_variance", 0.0) or 0.0)
+    return (
+        f"n={getattr(profile, 'quote_count', 0)};"
+        f"med={_cell(getattr(profile, 'median_price', None))};"
+        f"min={_cell(getattr(profile, 'min_price', None))};"
+        f"dm={getattr(profile, 'delivery_mean', 0.0) or 0.0:.1f};"
+        f"dsd={std:.1f};"
+        f"hr={getattr(profile, 'risk_high_count', 0)};"
+        f"mr={getattr(profile, 'risk_medium_count', 0)}"
+    )
+
+
+@dataclass
+class RenderedOffers:
+    text: str
+    # Alias -> full supplier name, e.g. {"S1": "Acme Ltd"}
+    supplier_aliases: Dict[str, str] = field(default_factory=dict)
+    offers_included: int = 0
+
+    @property
+    def suppliers(self) -> Set[str]:
+        return set(self.supplier_aliases.values())
+
+    def resolve_supplier(self, value: str) -> str:
+        """
+        Map an alias the model echoed back (e.g. "S1") to the full supplier name.
+        """
+        return self.supplier_aliases.get(value, value)
+
+
+def render_offers(
+    offers: Iterable[object],
+    profiles: Optional[Mapping[Tuple[str, str], object]] = None,
+    field_token_budget: Optional[int] = None,
+    token_budget: Optional[int] = None,
+) -> RenderedOffers:
+    """
+    Render offers as a compact, deduplicated table.
+
+    - field_token_budget caps each free-text value (item, risk); defaults to settings
+    - token_budget caps the whole block; offers are kept in retrieval order and
+      trailing offers are dropped once the budget would be exceeded (at least one is always kept)
+    """
+    if field_token_budget is None:
+        field_token_budget = settings.prompt_field_token_budget
+    if token_budget is None:
+        token_budget = settings.prompt_offers_token_budget
+
+    supplier_alias: Dict[str, str] = {}
+    item_alias: Dict[str, str] = {}
+    rows: List[str] = []
+    histories: Dict[str, str] = {}
+
+    for o in offers:
+        supplier = getattr(o, "supplier", None) or "Unknown"
+        raw_item = getattr(o, "item", None) or ""
+        # Alias on the full text; only the Items: list shows the truncated form
+        item = _cell(raw_item) if raw_item else ""
+        risk = truncate_to_tokens(_cell(getattr(o, "risk_assessment", None) or ""), field_token_budget)
+
+        s_alias = supplier_alias.get(supplier) or f"S{len(supplier_alias) + 1}"
+        i_alias = (item_alias.get(item) or f"I{len(item_alias) + 1}") if item else "?"
+
+        row = "|".join(
+            [
+                s_alias,
+                i_alias,
+                _cell(getattr(o, "unit_price", None)),
+                _cell(getattr(o, "delivery_days", None)),
+                risk,
+            ]
+        )
+
+        candidate_histories = dict(histories)
+        if profiles:
+            history = _history_cell(profiles.get((getattr(o, "supplier", None), raw_item)))
+            if history:
+                candidate_histories.setdefault(f"{s_alias}/{i_alias}", history)
+
+        candidate_suppliers = dict(supplier_alias)
+        candidate_suppliers.setdefault(supplier, s_alias)
+        candidate_items = dict(item_alias)
+        if item:
+            candidate_items.setdefault(item, i_alias)
+
+        text = _format_block(
+            candidate_suppliers, candidate_items, rows + [row], candidate_histories, field_token_budget
+        )
+        if rows and token_budget and token_budget > 0 and count_tokens(text) > token_budget:
+            break
+
+        supplier_alias, item_alias, histories = candidate_suppliers, candidate_items, candidate_histories
+        rows.append(row)
+
+    text = _format_block(supplier_alias, item_alias, rows, histories, field_token_budget)
+    return RenderedOffers(
+        text=text,
+        supplier_aliases={alias: name for name, alias in supplier_alias.items()},
+        offers_included=len(rows),
+    )
+
+
+def _format_block(
+    suppliers: Dict[str, str],
+    items: Dict[str, str],
+    rows: List[str],
+    histories: Dict[str, str],
+    field_token_budget: Optional[int],
+) -> str:
+    lines: List[str] = ["Suppliers:"]
+    lines.extend(f"{alias}={name}" for name, alias in suppliers.items())
+    if items:
+        lines.append("Items:")
+        lines.extend(f"{alias}={truncate_to_tokens(name, field_token_budget)}" for name, alias in items.items())
+    lines.append(OFFER_COLUMNS_LEGEND)
+    lines.append("Offers (s|i|p|d|r):")
+    lines.extend(rows)
+    if histories:
+        lines.append(HISTORY_LEGEND)
+        lines.extend(f"{key}: {history}" for key, history in histories.items())
+    return "\n".join(lines)
+
+
+# Per-request prompt token usage, keyed by agent; set by track_prompt_tokens
+_prompt_usage: ContextVar[Optional[Dict[str, int]]] = ContextVar("prompt_usage", default=None)
+
+
+@contextmanager
+def track_prompt_tokens() -> Iterator[Dict[str, int]]:
+    """
+    Collect the prompt token counts of every LLM call made inside the block.
+
+    Yields a dict filled in as calls happen, e.g. {"evaluator": 412, "summarizer": 198}.
+    """
+    usage: Dict[str, int] = {}
+    token = _prompt_usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _prompt_usage.reset(token)
+
+
+def log_prompt_tokens(agent: str, system: str, user: str) -> int:
+    """
+    Count the prompt tokens for one LLM call, record them for the active
+    track_prompt_tokens block (if any) and log them. Returns the count.
+    """
+    tokens = count_tokens(system) + count_tokens(user)
+
+    usage = _prompt_usage.get()
+    if usage is not None:
+        usage[agent] = usage.get(agent, 0) + tokens
+
+    logger.info("%s prompt tokens: %d", agent, tokens)
+    return tokens
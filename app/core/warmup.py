@@ -0,0 +1,25 @@
+from app.core.db import check_database
+from app.core.llm_client import LLMClientError, build_llm_client
+
+
+def warm_up() -> None:
+    """
+    Pre-load heavy dependencies so the first request does not pay for them.
+
+    - ORM models, pgvector and NumPy (via the service modules)
+    - The local tokenizer used for prompt budgets
+    - The OpenAI SDK (only if an API key is configured)
+    - A pooled database connection
+    """
+    import app.services.ingestion_service  # noqa: F401
+    import app.services.query_service  # noqa: F401
+    from app.core.prompt_builder import count_tokens
+
+    count_tokens("warm-up")
+
+    try:
+        build_llm_client()
+    except LLMClientError:
+        pass
+
+    check_database()
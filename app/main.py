@@ -1,14 +1,20 @@
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from app.api.v1.routes import router as api_v1_router
-from app.core.db import Base, engine, init_db
-from app.models import db_models
+from app.core.config import settings
+from app.core.db import check_database, migrate_schema
 
 app = FastAPI(title="Multi-Agent Supplier RAG API")
 
 @app.on_event("startup")
 def on_startup():
-    init_db()
-    Base.metadata.create_all(bind=engine)
+    # In multi-worker deployments run `python -m app.cli migrate` once and set MIGRATE_ON_STARTUP=false
+    if settings.migrate_on_startup:
+        migrate_schema()
+    if settings.warmup_on_startup:
+        from app.core.warmup import warm_up
+
+        warm_up()
 
 @app.get("/")
 def read_root():
@@ -16,7 +22,19 @@ def read_root():
 
 @app.get("/health")
 def health_check():
+    """
+    Liveness: the process is up and serving requests.
+    """
     return {"status": "ok"}
 
-app.include_router(api_v1_router, prefix="/api/v1")
+@app.get("/ready")
+def readiness_check():
+    """
+    Readiness: the database is reachable and the schema has been migrated.
+    """
+    reason = check_database()
+    if reason is not None:
+        return JSONResponse(status_code=503, content={"status": "not ready", "reason": reason})
+    return {"status": "ready"}
 
+app.include_router(api_v1_router, prefix="/api/v1")
@@ -1,14 +1,27 @@
 from typing import List
 
-from sqlalchemy import String, Integer, Float, Text
+from sqlalchemy import String, Integer, Float, Text, Computed, Index
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 from pgvector.sqlalchemy import Vector
 
 from app.core.db import Base
 from app.core.embeddings import EMBEDDING_DIM
 
+# Expression backing the generated full-text column. Kept as a module constant so
+# migrate_schema can add the column to tables created before it existed.
+SEARCH_TSV_EXPRESSION = (
+    "to_tsvector('english', "
+    "coalesce(supplier_name, '') || ' ' || "
+    "coalesce(item_description, '') || ' ' || "
+    "coalesce(raw_text, ''))"
+)
+
 class Quotation(Base):
     __tablename__ = "quotations"
+    __table_args__ = (
+        Index("ix_quotations_search_tsv", "search_tsv", postgresql_using="gin"),
+    )
 
     # Primary key
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
@@ -31,3 +44,44 @@ class Quotation(Base):
 
     # Embedding vector used for similarity search
     embedding: Mapped[List[float]] = mapped_column(Vector(EMBEDDING_DIM))
+
+    # Generated full-text vector used for lexical / hybrid search (maintained by Postgres)
+    search_tsv: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(SEARCH_TSV_EXPRESSION, persisted=True),
+        nullable=True,
+    )
+
+
+class SupplierProfile(Base):
+    """
+    Materialized per-supplier, per-item-category history.
+
+    Maintained incrementally by ingest_quotation and rebuildable in bulk
+    (see app.services.supplier_profile_service).
+    """
+    __tablename__ = "supplier_profiles"
+
+    supplier_name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    item_category: Mapped[str] = mapped_column(String(100), primary_key=True)
+
+    quote_count: Mapped[int] = mapped_column(Integer, default=0)
+
+    # Price history
+    min_price: Mapped[float | None] = mapped_column(Float, nullable=True)
+    # Rolling median over recent_prices (the last MEDIAN_PRICE_WINDOW quotations)
+    median_price: Mapped[float | None] = mapped_column(Float, nullable=True)
+    recent_prices: Mapped[List[float]] = mapped_column(ARRAY(Float), default=list)
+
+    # Delivery history (Welford running mean + sum of squared deviations)
+    delivery_mean: Mapped[float] = mapped_column(Float, default=0.0)
+    delivery_m2: Mapped[float] = mapped_column(Float, default=0.0)
+
+    # Risk notes bucketed by severity
+    risk_high_count: Mapped[int] = mapped_column(Integer, default=0)
+    risk_medium_count: Mapped[int] = mapped_column(Integer, default=0)
+    risk_low_count: Mapped[int] = mapped_column(Integer, default=0)
+
+    @property
+    def delivery_variance(self) -> float:
+        return self.delivery_m2 / self.quote_count if self.quote_count else 0.0
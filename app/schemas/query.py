@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List, Literal
 from pydantic import BaseModel
 
 class OfferEvaluation(BaseModel):
@@ -10,9 +10,13 @@ class OfferEvaluation(BaseModel):
 
 class QueryRequest(BaseModel):
     query: str
+    # "vector" = cosine similarity only, "hybrid" = full-text + vector fused with RRF
+    retrieval_mode: Literal["vector", "hybrid"] = "vector"
 
 
 class QueryResponse(BaseModel):
     recommendation: str
     reasoning: str
     offers_evaluated: List[OfferEvaluation]
+    # Prompt tokens sent per LLM agent for this query (empty when no LLM was used)
+    prompt_tokens: Dict[str, int] = {}
@@ -1,8 +1,11 @@
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app.core.db import QUOTATION_WRITE_LOCK_ID
 from app.models.db_models import Quotation
 from app.core.embeddings import generate_embedding, EMBEDDING_DIM
 from app.agents.extractor_agent import extract_quotation
+from app.services.supplier_profile_service import update_supplier_profile
 
 
 def ingest_quotation(text: str, db: Session, llm_client) -> Quotation:
@@ -11,6 +14,7 @@ def ingest_quotation(text: str, db: Session, llm_client) -> Quotation:
     - extract structured fields using ExtractorAgent
     - generate an embedding
     - store everything in the quotations table
+    - fold the quotation into its supplier profile (same transaction)
     """
 
     extracted = extract_quotation(llm_client, text)
@@ -33,7 +37,11 @@ def ingest_quotation(text: str, db: Session, llm_client) -> Quotation:
         embedding=embedding,
     )
 
+    # Held until commit so snapshot export can wait for in-flight ids (see export_snapshot)
+    db.execute(text("SELECT pg_advisory_xact_lock_shared(:id)"), {"id": QUOTATION_WRITE_LOCK_ID})
     db.add(quotation)
+    db.flush()
+    update_supplier_profile(db, quotation)
     db.commit()
     db.refresh(quotation)
     return quotation
@@ -4,19 +4,29 @@ from app.agents.retriever_agent import retrieve_quotations
 from app.schemas.query import QueryResponse, OfferEvaluation
 from app.services.evaluation_service import evaluate_retrieved_offers
 from app.agents.summarizer_agent import summarize_decision
+from app.core.prompt_builder import track_prompt_tokens
+from app.services.supplier_profile_service import load_supplier_profiles
 
 
-def run_query(text: str, db: Session, top_k: int = 5, llm_client=None) -> QueryResponse:
+def run_query(
+    text: str,
+    db: Session,
+    top_k: int = 5,
+    llm_client=None,
+    retrieval_mode: str = "vector",
+) -> QueryResponse:
     """
     Orchestrate the query workflow.
 
     Steps:
-    - Retrieve top-k most similar quotations (pgvector similarity search)
+    - Retrieve top-k most similar quotations (pgvector similarity, optionally fused with full-text search)
     - Map retrieved quotations into OfferEvaluation objects
+    - Load the matching supplier profiles in one batched lookup
     - Evaluate offers to produce recommendation + reasoning (LLM if available, fallback otherwise)
     - Generate a brief summary and prepend it to the reasoning
+    - Report the prompt tokens each LLM agent used
     """
-    retrieved = retrieve_quotations(query=text, db=db, top_k=top_k)
+    retrieved = retrieve_quotations(query=text, db=db, top_k=top_k, mode=retrieval_mode)
 
     offers = [
         OfferEvaluation(
@@ -29,18 +39,22 @@ def run_query(text: str, db: Session, top_k: int = 5, llm_client=None) -> QueryR
         for q in retrieved
     ]
 
-    recommendation, reasoning = evaluate_retrieved_offers(
-        user_query=text,
-        offers=offers,
-        llm_client=llm_client,
-    )
+    profiles = load_supplier_profiles(db, offers)
 
-    summary = summarize_decision(
-        user_query=text,
-        recommendation=recommendation,
-        offers=offers,
-        llm_client=llm_client,
-    )
+    with track_prompt_tokens() as prompt_tokens:
+        recommendation, reasoning = evaluate_retrieved_offers(
+            user_query=text,
+            offers=offers,
+            llm_client=llm_client,
+            profiles=profiles,
+        )
+
+        summary = summarize_decision(
+            user_query=text,
+            recommendation=recommendation,
+            offers=offers,
+            llm_client=llm_client,
+        )
 
     if summary:
         reasoning = f"{summary}\n\n{reasoning}"
@@ -49,4 +63,5 @@ def run_query(text: str, db: Session, top_k: int = 5, llm_client=None) -> QueryR
         recommendation=recommendation,
         reasoning=reasoning,
         offers_evaluated=offers,
+        prompt_tokens=prompt_tokens,
     )
@@ -0,0 +1,268 @@
+"""
+Columnar snapshots of the quotation corpus.
+
+A snapshot is a directory holding Parquet part files plus a manifest.json:
+- Export appends one part per run with the rows above the manifest's id watermark
+- Import bulk loads parts with COPY via a staging table, skipping ids the target already has
+
+Both directions stream fixed-size chunks, so memory stays constant regardless
+of corpus size. No LLM or embedding calls are made.
+"""
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, select, text
+
+from app.core.db import QUOTATION_WRITE_LOCK_ID, engine
+from app.core.embeddings import EMBEDDING_DIM
+from app.models.db_models import Quotation
+
+MANIFEST_FILE = "manifest.json"
+SNAPSHOT_FORMAT = "quotations-snapshot"
+SNAPSHOT_VERSION = 1
+
+# Everything except the generated search_tsv column, which Postgres recomputes on load
+COLUMNS = [
+    "id",
+    "supplier_name",
+    "item_description",
+    "unit_price",
+    "currency",
+    "min_quantity",
+    "delivery_days",
+    "payment_terms",
+    "internal_note",
+    "risk_assessment",
+    "raw_text",
+    "embedding",
+]
+
+
+class SnapshotError(RuntimeError):
+    pass
+
+
+@dataclass
+class SnapshotResult:
+    rows: int
+    last_id: int
+    part: Optional[str] = None
+    # Import only: snapshot rows whose id already existed in the target
+    skipped: int = 0
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa  # type: ignore
+        import pyarrow.parquet as pq  # type: ignore
+    except Exception as e:
+        raise SnapshotError("pyarrow not installed. Add 'pyarrow' to requirements.txt.") from e
+    return pa, pq
+
+
+def _arrow_schema(pa):
+    return pa.schema(
+        [
+            ("id", pa.int64()),
+            ("supplier_name", pa.string()),
+            ("item_description", pa.string()),
+            ("unit_price", pa.float64()),
+            ("currency", pa.string()),
+            ("min_quantity", pa.int32()),
+            ("delivery_days", pa.int32()),
+            ("payment_terms", pa.string()),
+            ("internal_note", pa.string()),
+            ("risk_assessment", pa.string()),
+            ("raw_text", pa.string()),
+            ("embedding", pa.list_(pa.float32(), EMBEDDING_DIM)),
+        ]
+    )
+
+
+def _read_manifest(snapshot_dir: str) -> Dict[str, Any]:
+    path = os.path.join(snapshot_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {
+            "format": SNAPSHOT_FORMAT,
+            "version": SNAPSHOT_VERSION,
+            "embedding_dim": EMBEDDING_DIM,
+            "last_id": 0,
+            "row_count": 0,
+            "parts": [],
+        }
+
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format") != SNAPSHOT_FORMAT or manifest.get("version") != SNAPSHOT_VERSION:
+        raise SnapshotError(f"Unsupported snapshot manifest in {snapshot_dir}")
+    if manifest.get("embedding_dim") != EMBEDDING_DIM:
+        raise SnapshotError(
+            f"Embedding dim mismatch: snapshot has {manifest.get('embedding_dim')} expected {EMBEDDING_DIM}"
+        )
+    return manifest
+
+
+def _write_manifest(snapshot_dir: str, manifest: Dict[str, Any]) -> None:
+    path = os.path.join(snapshot_dir, MANIFEST_FILE)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def export_snapshot(snapshot_dir: str, chunk_size: int = 1000) -> SnapshotResult:
+    """
+    Append quotations with id above the snapshot's watermark as a new Parquet part.
+
+    Rows are read through a server-side cursor and written one row group per chunk.
+
+    Ingests can commit out of id order, so the export first waits for in-flight
+    ingests (exclusive QUOTATION_WRITE_LOCK_ID) and only exports up to the max id
+    committed at that point; later ids are picked up by the next export.
+    """
+    import numpy as np
+
+    pa, pq = _pyarrow()
+    schema = _arrow_schema(pa)
+
+    os.makedirs(snapshot_dir, exist_ok=True)
+    manifest = _read_manifest(snapshot_dir)
+    watermark = int(manifest["last_id"])
+
+    with engine.begin() as conn:
+        conn.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": QUOTATION_WRITE_LOCK_ID})
+        upper = conn.execute(select(func.coalesce(func.max(Quotation.id), 0))).scalar_one()
+
+    stmt = (
+        select(*(getattr(Quotation, name) for name in COLUMNS))
+        .where(Quotation.id > watermark, Quotation.id <= upper)
+        .order_by(Quotation.id)
+    )
+
+    tmp_path = os.path.join(snapshot_dir, "part.parquet.tmp")
+    writer = None
+    rows = 0
+    first_id: Optional[int] = None
+    last_id = watermark
+    try:
+        with engine.connect() as conn:
+            result = conn.execution_options(stream_results=True, yield_per=chunk_size).execute(stmt)
+            for chunk in result.partitions(chunk_size):
+                columns: Dict[str, List[Any]] = {name: [] for name in COLUMNS[:-1]}
+                for row in chunk:
+                    for name in COLUMNS[:-1]:
+                        columns[name].append(getattr(row, name))
+
+                embeddings = np.asarray([row.embedding for row in chunk], dtype=np.float32).reshape(-1)
+                arrays = [pa.array(columns[name], type=schema.field(name).type) for name in COLUMNS[:-1]]
+                arrays.append(pa.FixedSizeListArray.from_arrays(pa.array(embeddings), EMBEDDING_DIM))
+
+                if writer is None:
+                    writer = pq.ParquetWriter(tmp_path, schema, compression="zstd")
+                writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+
+                if first_id is None:
+                    first_id = columns["id"][0]
+                last_id = columns["id"][-1]
+                rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if rows == 0:
+        return SnapshotResult(rows=0, last_id=watermark)
+
+    part = f"part-{first_id:010d}-{last_id:010d}.parquet"
+    os.replace(tmp_path, os.path.join(snapshot_dir, part))
+
+    manifest["parts"].append({"file": part, "first_id": first_id, "last_id": last_id, "rows": rows})
+    manifest["last_id"] = last_id
+    manifest["row_count"] = int(manifest["row_count"]) + rows
+    _write_manifest(snapshot_dir, manifest)
+
+    return SnapshotResult(rows=rows, last_id=last_id, part=part)
+
+
+def _vector_literal(values) -> str:
+    return "[" + ",".join(map(repr, values)) + "]"
+
+
+def import_snapshot(snapshot_dir: str, chunk_size: int = 1000) -> SnapshotResult:
+    """
+    Bulk load a snapshot into the quotations table.
+
+    Each part is COPY-ed into a temporary staging table and inserted with
+    ON CONFLICT (id) DO NOTHING, so any id already present in the target is
+    skipped (the existing row is kept) and re-running an import is safe.
+    A part is not read at all only when its ids form a dense range that the
+    target already holds completely (a re-run of the same import).
+
+    One transaction per part file; the id sequence is advanced inside it.
+    """
+    _, pq = _pyarrow()
+
+    manifest = _read_manifest(snapshot_dir)
+    if not manifest["parts"]:
+        raise SnapshotError(f"No snapshot found in {snapshot_dir}")
+
+    table = Quotation.__tablename__
+    staging = f"{table}_import"
+    column_list = ", ".join(COLUMNS)
+
+    rows = 0
+    skipped = 0
+    last_id = 0
+    for part in manifest["parts"]:
+        last_id = max(last_id, part["last_id"])
+        with engine.begin() as conn:
+            # Counting ids in the range only proves the part's ids are present when
+            # the range has no gaps on either side; otherwise let ON CONFLICT decide
+            span = part["last_id"] - part["first_id"] + 1
+            if span == part["rows"]:
+                present = conn.execute(
+                    select(func.count()).where(Quotation.id.between(part["first_id"], part["last_id"]))
+                ).scalar_one()
+                if present == span:
+                    skipped += part["rows"]
+                    continue
+
+            conn.execute(
+                text(
+                    f"CREATE TEMP TABLE {staging} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"
+                )
+            )
+
+            parquet = pq.ParquetFile(os.path.join(snapshot_dir, part["file"]))
+            cursor = conn.connection.driver_connection.cursor()
+            with cursor.copy(f"COPY {staging} ({column_list}) FROM STDIN") as copy:
+                for batch in parquet.iter_batches(batch_size=chunk_size, columns=COLUMNS):
+                    data = batch.to_pydict()
+                    for i in range(batch.num_rows):
+                        values = [data[name][i] for name in COLUMNS[:-1]]
+                        values.append(_vector_literal(data["embedding"][i]))
+                        copy.write_row(values)
+            cursor.close()
+
+            inserted = conn.execute(
+                text(
+                    f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {staging} "
+                    "ON CONFLICT (id) DO NOTHING"
+                )
+            ).rowcount
+            rows += inserted
+            skipped += part["rows"] - inserted
+
+            # Advance the sequence before committing so later /upload calls never collide
+            conn.execute(
+                text(
+                    "SELECT setval(pg_get_serial_sequence(:table, 'id'), "
+                    f"(SELECT max(id) FROM {table}))"
+                ),
+                {"table": table},
+            )
+
+    return SnapshotResult(rows=rows, last_id=last_id, skipped=skipped)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import statistics
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.agents.evaluator_scoring import risk_bucket
+from app.core.categories import item_category
+from app.models.db_models import Quotation, SupplierProfile
+
+ProfileKey = Tuple[str, str]
+
+# The median price is taken over this many most recent quotations per profile
+MEDIAN_PRICE_WINDOW = 50
+
+
+def _apply_observation(
+    profile: SupplierProfile,
+    unit_price: Optional[float],
+    delivery_days: Optional[int],
+    risk_text: Optional[str],
+) -> None:
+    """
+    Fold one quotation into a profile's running stats. Constant work per call.
+    """
+    profile.quote_count = (profile.quote_count or 0) + 1
+
+    if unit_price is not None:
+        profile.min_price = unit_price if profile.min_price is None else min(profile.min_price, unit_price)
+
+        # Bounded rolling window; assign a new list so the ORM sees the change
+        recent = (list(profile.recent_prices or []) + [unit_price])[-MEDIAN_PRICE_WINDOW:]
+        profile.recent_prices = recent
+        profile.median_price = statistics.median(recent)
+
+    # Welford's online update keeps mean/variance exact without revisiting history
+    days = float(delivery_days or 0)
+    mean = profile.delivery_mean or 0.0
+    delta = days - mean
+    mean += delta / profile.quote_count
+    profile.delivery_mean = mean
+    profile.delivery_m2 = (profile.delivery_m2 or 0.0) + delta * (days - mean)
+
+    bucket = risk_bucket(risk_text or "")
+    if bucket == "high":
+        profile.risk_high_count = (profile.risk_high_count or 0) + 1
+    elif bucket == "medium":
+        profile.risk_medium_count = (profile.risk_medium_count or 0) + 1
+    elif bucket == "low":
+        profile.risk_low_count = (profile.risk_low_count or 0) + 1
+
+
+def update_supplier_profile(db: Session, quotation: Quotation) -> SupplierProfile:
+    """
+    Incrementally fold a newly ingested quotation into its supplier profile.
+
+    - Running stats (count, min price, delivery mean/variance, risk counts) are updated in place
+    - The median price is a rolling median over the last MEDIAN_PRICE_WINDOW quotations,
+      kept on the profile row, so no quotation history is read
+
+    The quotation must already be flushed; the caller owns the commit.
+    """
+    category = item_category(quotation.item_description)
+    key = {"supplier_name": quotation.supplier_name, "item_category": category}
+
+    # Create the row if missing, then lock it so concurrent ingests serialize per profile
+    db.execute(
+        pg_insert(SupplierProfile)
+        .values(
+            **key,
+            quote_count=0,
+            delivery_mean=0.0,
+            delivery_m2=0.0,
+            risk_high_count=0,
+            risk_medium_count=0,
+            risk_low_count=0,
+            recent_prices=[],
+        )
+        .on_conflict_do_nothing()
+    )
+    profile = db.get(
+        SupplierProfile,
+        (quotation.supplier_name, category),
+        with_for_update=True,
+        populate_existing=True,
+    )
+
+    _apply_observation(
+        profile,
+        unit_price=quotation.unit_price,
+        delivery_days=quotation.delivery_days,
+        risk_text=quotation.risk_assessment,
+    )
+
+    return profile
+
+
+def rebuild_supplier_profiles(db: Session, batch_size: int = 1000) -> int:
+    """
+    Rebuild the supplier_profiles table from scratch in a single streamed pass.
+
+    Quotations are replayed in id order, so the result matches what incremental
+    ingestion would have produced. Returns the number of profiles written.
+    """
+    db.execute(delete(SupplierProfile))
+
+    profiles: Dict[ProfileKey, SupplierProfile] = {}
+    rows = db.execute(
+        select(
+            Quotation.supplier_name,
+            Quotation.item_description,
+            Quotation.unit_price,
+            Quotation.delivery_days,
+            Quotation.risk_assessment,
+        )
+        .order_by(Quotation.id)
+        .execution_options(yield_per=batch_size)
+    )
+    for supplier, description, unit_price, delivery_days, risk_text in rows:
+        key = (supplier, item_category(description))
+        profile = profiles.get(key)
+        if profile is None:
+            profile = SupplierProfile(
+                supplier_name=key[0],
+                item_category=key[1],
+                quote_count=0,
+                delivery_mean=0.0,
+                delivery_m2=0.0,
+                risk_high_count=0,
+                risk_medium_count=0,
+                risk_low_count=0,
+                recent_prices=[],
+            )
+            profiles[key] = profile
+
+        _apply_observation(profile, unit_price, delivery_days, risk_text)
+
+    db.add_all(profiles.values())
+    db.commit()
+    return len(profiles)
+
+
+def load_supplier_profiles(db: Session, offers: Iterable[object]) -> Dict[Tuple[str, str], SupplierProfile]:
+    """
+    Fetch the profiles relevant to a set of offers in one batched query.
+
+    Returns a mapping keyed by (supplier, item) exactly as they appear on the offers,
+    so evaluators can look profiles up without knowing how categories are derived.
+    """
+    by_offer: Dict[Tuple[str, str], ProfileKey] = {}
+    for o in offers:
+        supplier = getattr(o, "supplier", None)
+        item = getattr(o, "item", None) or ""
+        if supplier:
+            by_offer[(supplier, item)] = (supplier, item_category(item))
+
+    if not by_offer:
+        return {}
+
+    profile_keys = set(by_offer.values())
+    profiles = db.scalars(
+        select(SupplierProfile).where(
+            tuple_(SupplierProfile.supplier_name, SupplierProfile.item_category).in_(profile_keys)
+        )
+    ).all()
+    by_key = {(p.supplier_name, p.item_category): p for p in profiles}
+
+    return {offer_key: by_key[pk] for offer_key, pk in by_offer.items() if pk in by_key}
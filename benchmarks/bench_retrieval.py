@@ -0,0 +1,130 @@
+"""
+Retrieval benchmark: vector vs hybrid (full-text + vector, RRF) search.
+
+Seeds a synthetic quotation corpus directly into the database (no LLM calls),
+runs part-number / supplier-name queries against each retrieval mode and reports
+latency (p50/p95) and hit quality (hit@k, MRR). Seeded rows are removed afterwards.
+
+Usage (against a running Postgres + pgvector, e.g. inside the api container):
+    python -m benchmarks.bench_retrieval --rows 2000 --queries 200
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+from typing import Dict, List
+
+from sqlalchemy import delete
+
+from app.agents.retriever_agent import RETRIEVAL_MODES, retrieve_quotations
+from app.core.db import SessionLocal, migrate_schema
+from app.core.embeddings import generate_embedding
+from app.models.db_models import Quotation
+
+SUPPLIER_PREFIXES = ["Acme", "SteelWorks", "Nordic", "Atlas", "Vertex", "Orion", "Delta", "Summit"]
+SUPPLIER_SUFFIXES = ["Ltd", "GmbH", "Industrial", "Supplies", "Fasteners", "Components"]
+MATERIALS = ["stainless", "galvanised", "zinc-plated", "brass", "carbon steel"]
+ITEMS = ["bolts", "nuts", "washers", "hex screws", "threaded rods", "rivets"]
+SIZES = ["M4", "M5", "M6", "M8", "M10", "M12"]
+RISK_NOTES = ["Low risk, reliable", "Medium risk, mixed history", "High risk, frequent delays", ""]
+
+
+def build_corpus(rows: int, rng: random.Random) -> List[Dict[str, object]]:
+    corpus: List[Dict[str, object]] = []
+    for i in range(rows):
+        supplier = f"{rng.choice(SUPPLIER_PREFIXES)} {rng.choice(SUPPLIER_SUFFIXES)} {i % 97}"
+        part_number = f"PN-{i:06d}"
+        item = f"{rng.choice(SIZES)} {rng.choice(MATERIALS)} {rng.choice(ITEMS)} ({part_number})"
+        unit_price = round(rng.uniform(0.05, 2.5), 2)
+        delivery_days = rng.randint(1, 30)
+        risk = rng.choice(RISK_NOTES)
+        raw_text = (
+            f"Supplier {supplier} offers {item} at {unit_price} EUR per unit. "
+            f"Delivery within {delivery_days} days. {risk}"
+        )
+        corpus.append(
+            {
+                "supplier_name": supplier,
+                "item_description": item,
+                "unit_price": unit_price,
+                "currency": "EUR",
+                "min_quantity": 1,
+                "delivery_days": delivery_days,
+                "payment_terms": "Net 30",
+                "internal_note": None,
+                "risk_assessment": risk or None,
+                "raw_text": raw_text,
+                "part_number": part_number,
+            }
+        )
+    return corpus
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[idx]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2000, help="Synthetic quotations to seed")
+    parser.add_argument("--queries", type=int, default=200, help="Queries to run per mode")
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+
+    migrate_schema()
+
+    corpus = build_corpus(args.rows, rng)
+    db = SessionLocal()
+    seeded_ids: List[int] = []
+    try:
+        rows = []
+        for entry in corpus:
+            fields = {k: v for k, v in entry.items() if k != "part_number"}
+            rows.append(Quotation(**fields, embedding=generate_embedding(str(entry["raw_text"]))))
+        db.add_all(rows)
+        db.commit()
+        seeded_ids = [q.id for q in rows]
+
+        targets = rng.sample(range(len(rows)), min(args.queries, len(rows)))
+        print(f"Seeded {len(rows)} quotations; running {len(targets)} queries per mode (top_k={args.top_k})\n")
+        print(f"{'mode':<8} {'p50 ms':>8} {'p95 ms':>8} {'hit@k':>7} {'MRR':>6}")
+
+        for mode in RETRIEVAL_MODES:
+            latencies: List[float] = []
+            hits = 0
+            reciprocal_ranks: List[float] = []
+            for idx in targets:
+                entry = corpus[idx]
+                query = f"{entry['part_number']} {entry['item_description']} from {entry['supplier_name']}"
+
+                start = time.perf_counter()
+                results = retrieve_quotations(query=query, db=db, top_k=args.top_k, mode=mode)
+                latencies.append((time.perf_counter() - start) * 1000.0)
+
+                result_ids = [q.id for q in results]
+                if seeded_ids[idx] in result_ids:
+                    hits += 1
+                    reciprocal_ranks.append(1.0 / (result_ids.index(seeded_ids[idx]) + 1))
+                else:
+                    reciprocal_ranks.append(0.0)
+
+            print(
+                f"{mode:<8} {percentile(latencies, 50):>8.2f} {percentile(latencies, 95):>8.2f} "
+                f"{hits / len(targets):>7.3f} {statistics.fmean(reciprocal_ranks):>6.3f}"
+            )
+    finally:
+        if seeded_ids:
+            db.execute(delete(Quotation).where(Quotation.id.in_(seeded_ids)))
+            db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Cold-start benchmark: import time of the ASGI app and which heavy modules it pulls in.
+
+Each run happens in a fresh interpreter so nothing is cached in sys.modules.
+Optionally also times the startup hook (schema migration / warm-up), which needs a database.
+
+Usage:
+    python -m benchmarks.bench_startup --runs 10
+    MIGRATE_ON_STARTUP=false WARMUP_ON_STARTUP=true python -m benchmarks.bench_startup --startup
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+HEAVY_MODULES = ["openai", "numpy", "pgvector", "tiktoken", "app.models.db_models", "app.services.query_service"]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+startup_ms = None
+if {run_startup}:
+    app.main.on_startup()
+    startup_ms = (time.perf_counter() - imported) * 1000.0
+print(json.dumps({{
+    "import_ms": (imported - start) * 1000.0,
+    "startup_ms": startup_ms,
+    "loaded": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+
+def run_probe(run_startup: bool) -> Dict[str, object]:
+    code = _PROBE.format(run_startup=run_startup, heavy=HEAVY_MODULES)
+    out = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--startup", action="store_true", help="Also run the startup hook (requires a database)")
+    args = parser.parse_args()
+
+    import_ms: List[float] = []
+    startup_ms: List[float] = []
+    loaded: List[str] = []
+    for _ in range(args.runs):
+        result = run_probe(args.startup)
+        import_ms.append(float(result["import_ms"]))
+        if result["startup_ms"] is not None:
+            startup_ms.append(float(result["startup_ms"]))
+        loaded = list(result["loaded"])
+
+    print(f"import app.main: median {statistics.median(import_ms):.1f} ms, max {max(import_ms):.1f} ms ({args.runs} runs)")
+    if startup_ms:
+        print(f"startup hook:    median {statistics.median(startup_ms):.1f} ms, max {max(startup_ms):.1f} ms")
+    print(f"heavy modules loaded after startup: {', '.join(loaded) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import pytest
+
+from app.core.categories import UNKNOWN_CATEGORY, item_category
+
+
+@pytest.mark.parametrize(
+    "description, expected",
+    [
+        ("10mm steel bolts (SB-10)", "bolt"),
+        ("Stainless steel bolts for marine use", "bolt"),
+        ("Bolts M8 x 40mm, zinc plated", "bolt"),
+        ("Hex bolts DIN 933 M10", "bolt"),
+        ("M8 stainless nuts", "nut"),
+        ("Brass washers - ISO 7089", "washer"),
+        ("Box of 100 wood screws", "screw"),
+        ("A4 paper, 80gsm", "paper"),
+        ("gas", "gas"),
+        ("glasses", "glass"),
+        ("Lithium batteries with charger", "battery"),
+        ("threaded rods (PN-000001)", "rod"),
+        ("Cable ties 200mm", "tie"),
+        ("Nitrile gloves size L", "glove"),
+        ("Safety helmets colour white", "helmet"),
+        ("knives", "knife"),
+        ("Hydraulic valves", "valve"),
+        ("Drive belts", "belt"),
+    ],
+)
+def test_item_category_uses_head_noun(description, expected):
+    assert item_category(description) == expected
+
+
+@pytest.mark.parametrize("description", [None, "", "   ", "M8 x 40mm", "(SB-10)"])
+def test_item_category_unknown(description):
+    assert item_category(description) == UNKNOWN_CATEGORY
+
+
+def test_same_item_phrased_differently_shares_category():
+    descriptions = [
+        "Stainless steel bolts for marine use",
+        "Bolts M8 x 40mm, zinc plated",
+        "Hex bolts DIN 933 M10",
+        "10mm steel bolts (SB-10)",
+    ]
+    assert {item_category(d) for d in descriptions} == {"bolt"}